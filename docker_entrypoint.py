@@ -37,7 +37,7 @@ def main():
         print("✅ NANONETS_API_KEY configured")
     
     # Import the web app module
-    from docstrange.web_app import app, check_gpu_availability, download_models
+    from docstrange.web_app import app, check_gpu_availability, start_model_download
     
     # Get configuration from environment
     host = os.environ.get('HOST', '0.0.0.0')
@@ -50,13 +50,9 @@ def main():
     if gpu_available:
         print("")
         print("✅ GPU detected - will use GPU mode for processing")
-        print("🔄 Downloading GPU models (this may take a few minutes on first run)...")
-        try:
-            download_models()
-            print("✅ Models ready")
-        except Exception as e:
-            print(f"⚠️  Warning: Could not download models: {e}")
-            print("Will proceed anyway - models will download on first use")
+        print("🔄 Downloading GPU models in the background (this may take a few minutes on first run)...")
+        print("   GPU requests will wait for the download; /api/health reports models_ready")
+        start_model_download()
     else:
         print("")
         print("💻 GPU not available - will use cloud mode for processing")
@@ -4,6 +4,7 @@ import argparse
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -100,6 +101,24 @@ def process_single_input(extractor: DocumentExtractor, input_item: str, output_f
         }
 
 
+def render_results(results: List, render, max_workers: int = 8) -> List:
+    """Render several results concurrently, preserving input order.
+    
+    Cloud results fetch their content lazily over HTTP, so rendering them in
+    parallel overlaps the API round-trips instead of paying them one by one.
+    
+    Args:
+        results: Conversion results to render
+        render: Callable taking a result and returning its rendered output
+        max_workers: Upper bound on concurrent renders
+        
+    Returns:
+        Rendered outputs in the same order as results
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(results)))) as executor:
+        return list(executor.map(render, results))
+
+
 def handle_login(force_reauth: bool = False) -> int:
     """Handle login command."""
     try:
@@ -476,9 +495,9 @@ docstrange document.pdf --model nanonets --output csv
     else:
         # Multiple results - combine them
         if args.output == "markdown":
-            output_content = "\n\n---\n\n".join(r.extract_markdown() for r in results)
+            output_content = "\n\n---\n\n".join(render_results(results, lambda r: r.extract_markdown()))
         elif args.output == "html":
-            output_content = "\n\n<hr>\n\n".join(r.extract_html() for r in results)
+            output_content = "\n\n<hr>\n\n".join(render_results(results, lambda r: r.extract_html()))
         elif args.output == "json":
             # Handle field extraction for multiple results
             json_schema = None
@@ -491,13 +510,10 @@ docstrange document.pdf --model nanonets --output csv
                     sys.exit(1)
             
             try:
-                extracted_results = []
-                for r in results:
-                    result_json = r.extract_data(
-                        specified_fields=args.extract_fields,
-                        json_schema=json_schema,
-                    )
-                    extracted_results.append(result_json)
+                extracted_results = render_results(results, lambda r: r.extract_data(
+                    specified_fields=args.extract_fields,
+                    json_schema=json_schema,
+                ))
                 
                 combined_json = {
                     "results": extracted_results,
@@ -523,7 +539,7 @@ docstrange document.pdf --model nanonets --output csv
                 sys.exit(1)
             output_content = "\n\n".join(csv_outputs)
         else:  # text
-            output_content = "\n\n---\n\n".join(r.extract_text() for r in results)
+            output_content = "\n\n---\n\n".join(render_results(results, lambda r: r.extract_text()))
     
     # Write output
     if args.output_file:
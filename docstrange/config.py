@@ -4,11 +4,19 @@ class InternalConfig:
     # Internal feature flags and defaults (not exposed to end users)
     use_markdownify = True
     ocr_provider = 'neural'  # OCR provider to use (neural for docling models)
+    nanonets_allow_cpu = False  # Load Nanonets OCR (gpu=True) without a CUDA GPU; development/testing only
     
     # PDF processing configuration
     pdf_to_image_enabled = True  # Convert PDF pages to images for OCR
-    pdf_image_dpi = 300  # DPI for PDF to image conversion
+    pdf_fast_text_extract = True  # Use the embedded text layer of born-digital PDFs (needs PyMuPDF) instead of OCR
+    pdf_image_dpi = 300  # DPI for PDF to image conversion (GPU/Nanonets path)
+    pdf_ocr_image_dpi = 200  # DPI for PDFProcessor page OCR (neural models)
+    pdf_image_dpi_small_text = 300  # DPI for small-format pages (receipts, labels) with small print in PDFProcessor
+    pdf_image_max_size = 3300  # Cap on the longest PDFProcessor page side in pixels (A3 at 200 DPI)
     pdf_image_scale = 2.0  # Scale factor for better OCR accuracy
+    pdf_intermediate_format = 'JPEG'  # Page image format handed to OCR: JPEG, PNG or TIFF (PNG is used when include_images=True)
+    pdf_ocr_workers = 1  # OCR worker processes for PDF pages (1 = in-process, None = auto); >1 loads the models in every worker and needs an if __name__ == '__main__' guard in scripts
+    pdf_ocr_batch_size = 8  # PDF pages sent to each OCR worker per task
     
     # Add other internal config options here as needed
     # e.g. default_ocr_lang = 'en'
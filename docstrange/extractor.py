@@ -19,6 +19,7 @@ from .processors import (
 from .result import ConversionResult
 from .exceptions import ConversionError, UnsupportedFormatError, FileNotFoundError
 from .utils.gpu_utils import should_use_gpu_processor
+from .config import InternalConfig
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -62,7 +63,8 @@ class DocumentExtractor:
         self.cloud_mode = not self.gpu
         
         # Check GPU availability if GPU preference is set
-        if self.gpu and not should_use_gpu_processor():
+        allow_cpu = getattr(InternalConfig, 'nanonets_allow_cpu', False)
+        if self.gpu and not should_use_gpu_processor() and not allow_cpu:
             raise RuntimeError(
                 "GPU preference specified but no GPU is available. "
                 "Please ensure CUDA is installed and a compatible GPU is present."
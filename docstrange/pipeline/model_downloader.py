@@ -2,6 +2,7 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import requests
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class ModelDownloader:
     """Downloads pre-trained models from Hugging Face or Nanonets S3."""
     
+    # Read/write block size for model archive downloads (archives are hundreds of MB)
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    
     # Nanonets S3 model URLs (primary source)
     S3_BASE_URL = "https://public-vlms.s3-us-west-2.amazonaws.com/llm-data-extractor"
     
@@ -87,10 +91,15 @@ class ModelDownloader:
         if gpu_available:
             models_to_download.append(("Nanonets OCR Model", self.NANONETS_OCR_MODEL))
         
-        for model_name, model_config in models_to_download:
+        def download(model_entry):
+            model_name, model_config = model_entry
             logger.info(f"Downloading {model_name}...")
             self._download_model(model_config, force, progress)
         
+        # The models are independent archives, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(models_to_download)) as executor:
+            list(executor.map(download, models_to_download))
+        
         logger.info("All models downloaded successfully!")
         return self.cache_dir
     
@@ -263,15 +272,15 @@ class ModelDownloader:
         
         total_size = int(response.headers.get('content-length', 0))
         
-        with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp_file:
+        with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False, buffering=self.DOWNLOAD_CHUNK_SIZE) as tmp_file:
             if progress and total_size > 0:
                 with tqdm(total=total_size, unit='B', unit_scale=True, desc="Downloading") as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                         if chunk:
                             tmp_file.write(chunk)
                             pbar.update(len(chunk))
             else:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         tmp_file.write(chunk)
             
@@ -6,16 +6,31 @@ from typing import Optional
 from pathlib import Path
 from PIL import Image
 
+from ..utils.gpu_utils import is_gpu_available
+
 logger = logging.getLogger(__name__)
 
 
 class NanonetsDocumentProcessor:
     """Neural Document Processor using Nanonets OCR model."""
     
-    def __init__(self, cache_dir: Optional[Path] = None):
-        """Initialize the Neural Document Processor with Nanonets OCR."""
+    def __init__(self, cache_dir: Optional[Path] = None, allow_cpu: bool = False):
+        """Initialize the Neural Document Processor with Nanonets OCR.
+        
+        Args:
+            cache_dir: Directory with cached models
+            allow_cpu: Load the model even without a CUDA GPU (development/testing only)
+        """
         logger.info("Initializing Neural Document Processor with Nanonets OCR...")
         
+        # Fail before loading several GB of weights that would be unusable on CPU
+        if not allow_cpu and not is_gpu_available():
+            raise RuntimeError(
+                "Nanonets OCR requires a CUDA GPU: the model needs about 8 GB of GPU memory, "
+                "and CPU inference takes minutes per page. Use cloud mode instead, or set "
+                "InternalConfig.nanonets_allow_cpu = True for development and testing."
+            )
+        
         # Initialize models
         self._initialize_models(cache_dir)
         
@@ -2,11 +2,16 @@
 
 import os
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# OCR services shared by all processors in this process, keyed by provider
+_shared_services: Dict[str, "OCRService"] = {}
+_shared_services_lock = threading.Lock()
+
 
 class OCRService(ABC):
     """Abstract base class for OCR services."""
@@ -39,10 +44,17 @@ class OCRService(ABC):
 class NanonetsOCRService(OCRService):
     """Nanonets OCR implementation using NanonetsDocumentProcessor."""
     
-    def __init__(self):
-        """Initialize the service."""
+    def __init__(self, allow_cpu: Optional[bool] = None):
+        """Initialize the service.
+        
+        Args:
+            allow_cpu: Load the model without a CUDA GPU (defaults to config)
+        """
         from .nanonets_processor import NanonetsDocumentProcessor
-        self._processor = NanonetsDocumentProcessor()
+        if allow_cpu is None:
+            from docstrange.config import InternalConfig
+            allow_cpu = getattr(InternalConfig, 'nanonets_allow_cpu', False)
+        self._processor = NanonetsDocumentProcessor(allow_cpu=allow_cpu)
         logger.info("NanonetsOCRService initialized")
     
     @property
@@ -219,4 +231,31 @@ class OCRServiceFactory:
         Returns:
             List of available provider names
         """
-        return ['nanonets', 'neural'] 
\ No newline at end of file
+        return ['nanonets', 'neural']
+
+
+def get_shared_ocr_service(provider: str = None) -> OCRService:
+    """Get the process-wide OCR service for a provider, loading it on first use.
+    
+    Loading an OCR service loads its model weights, so processors created per
+    request share one instance instead of reloading the models every time.
+    
+    Args:
+        provider: OCR provider name (defaults to config)
+        
+    Returns:
+        Shared OCRService instance
+    """
+    from docstrange.config import InternalConfig
+    
+    if provider is None:
+        provider = getattr(InternalConfig, 'ocr_provider', 'nanonets')
+    provider = provider.lower()
+    
+    # Held while loading so concurrent cold-start requests load the models once
+    with _shared_services_lock:
+        service = _shared_services.get(provider)
+        if service is None:
+            service = OCRServiceFactory.create_service(provider)
+            _shared_services[provider] = service
+        return service
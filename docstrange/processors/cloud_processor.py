@@ -1,10 +1,13 @@
 """Cloud processor for Nanonets API integration."""
 
 import os
+import http.cookiejar
 import requests
 import json
 import logging
+import threading
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
 
 from .base import BaseProcessor
 from ..result import ConversionResult
@@ -12,6 +15,57 @@ from ..exceptions import ConversionError
 
 logger = logging.getLogger(__name__)
 
+# Output types accepted by the cloud extraction API
+VALID_OUTPUT_TYPES = frozenset(["markdown", "flat-json", "html", "csv", "specified-fields", "specified-json"])
+
+# Cloud extraction API endpoint
+API_URL = "https://extraction-api.nanonets.com/extract"
+
+# Upload content type for each file extension the cloud extraction API accepts
+CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.xls': 'application/vnd.ms-excel',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.txt': 'text/plain',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.tif': 'image/tiff'
+}
+
+# File extensions the cloud extraction API accepts
+SUPPORTED_EXTENSIONS = frozenset(CONTENT_TYPES)
+
+# Keep-alive session shared by all cloud API calls, so the per-output-type
+# requests for a document reuse one TLS connection instead of reconnecting
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session for the cloud extraction API.
+    
+    Returns:
+        requests.Session with a pooled keep-alive adapter
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            # Calls with different API keys share the session, so never keep cookies
+            _session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            _session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+        return _session
+
 
 class CloudConversionResult(ConversionResult):
     """Enhanced ConversionResult for cloud mode with lazy API calls."""
@@ -26,8 +80,7 @@ class CloudConversionResult(ConversionResult):
     def _get_cloud_output(self, output_type: str, specified_fields: Optional[list] = None, json_schema: Optional[dict] = None) -> str:
         """Get output from cloud API for specific type, with caching."""
         # Validate output type
-        valid_output_types = ["markdown", "flat-json", "html", "csv", "specified-fields", "specified-json"]
-        if output_type not in valid_output_types:
+        if output_type not in VALID_OUTPUT_TYPES:
             logger.warning(f"Invalid output type '{output_type}' for cloud API. Using 'markdown'.")
             output_type = "markdown"
         
@@ -74,7 +127,7 @@ class CloudConversionResult(ConversionResult):
                     logger.info(f"Making cloud API call without authentication (free tier) for {output_type} on {self.file_path}")
                 
                 # Make API request
-                response = requests.post(
+                response = _get_session().post(
                     self.cloud_processor.api_url,
                     headers=headers,
                     files=files,
@@ -230,7 +283,7 @@ class CloudProcessor(BaseProcessor):
         self.model_type = model_type
         self.specified_fields = specified_fields
         self.json_schema = json_schema
-        self.api_url = "https://extraction-api.nanonets.com/extract"
+        self.api_url = API_URL
         
         # Don't validate output_type during initialization - it will be validated during processing
         # This prevents warnings during DocumentExtractor initialization
@@ -239,14 +292,8 @@ class CloudProcessor(BaseProcessor):
         """Check if the processor can handle the file."""
         # Cloud processor supports most common document formats
         # API key is optional - without it, uses rate-limited free tier
-        supported_extensions = {
-            '.pdf', '.docx', '.doc', '.xlsx', '.xls', '.pptx', '.ppt', 
-            '.txt', '.html', '.htm', '.png', '.jpg', '.jpeg', '.gif', 
-            '.bmp', '.tiff', '.tif'
-        }
-        
         _, ext = os.path.splitext(file_path.lower())
-        return ext in supported_extensions
+        return ext in SUPPORTED_EXTENSIONS
     
     def process(self, file_path: str) -> CloudConversionResult:
         """Create a lazy CloudConversionResult that will make API calls on demand.
@@ -304,24 +351,4 @@ class CloudProcessor(BaseProcessor):
         """Get content type for file upload."""
         _, ext = os.path.splitext(file_path.lower())
         
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            '.xls': 'application/vnd.ms-excel',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.txt': 'text/plain',
-            '.html': 'text/html',
-            '.htm': 'text/html',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.bmp': 'image/bmp',
-            '.tiff': 'image/tiff',
-            '.tif': 'image/tiff'
-        }
-        
-        return content_types.get(ext, 'application/octet-stream') 
\ No newline at end of file
+        return CONTENT_TYPES.get(ext, 'application/octet-stream') 
\ No newline at end of file
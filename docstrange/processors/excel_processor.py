@@ -167,15 +167,11 @@ class ExcelProcessor(BaseProcessor):
         markdown_parts.append("| " + " | ".join(str(col) for col in df.columns) + " |")
         markdown_parts.append("| " + " | ".join(["---"] * len(df.columns)) + " |")
         
-        # Data rows
-        for _, row in df.iterrows():
-            row_data = []
-            for cell in row:
-                if pd.isna(cell):
-                    row_data.append("")
-                else:
-                    row_data.append(str(cell))
-            markdown_parts.append("| " + " | ".join(row_data) + " |")
+        # Data rows: blank out missing cells in one pass, then walk plain tuples
+        # (iterrows builds a Series per row and upcasts mixed int/float rows)
+        cells = df.astype(object).where(df.notna(), "")
+        for row in cells.itertuples(index=False, name=None):
+            markdown_parts.append("| " + " | ".join(map(str, row)) + " |")
         
         return "\n".join(markdown_parts)
     
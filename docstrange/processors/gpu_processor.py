@@ -3,6 +3,7 @@
 import os
 import json
 import logging
+import shutil
 import tempfile
 import re
 from typing import Dict, Any, List, Optional
@@ -11,7 +12,7 @@ from pathlib import Path
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
-from ..pipeline.ocr_service import OCRServiceFactory
+from ..pipeline.ocr_service import get_shared_ocr_service
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -281,8 +282,8 @@ class GPUProcessor(BaseProcessor):
         """Get OCR service instance."""
         if self._ocr_service is not None:
             return self._ocr_service
-        # Use Nanonets OCR service by default
-        self._ocr_service = OCRServiceFactory.create_service('nanonets')
+        # Use Nanonets OCR service by default, shared so the model loads once per process
+        self._ocr_service = get_shared_ocr_service('nanonets')
         return self._ocr_service
     
     def process(self, file_path: str) -> GPUConversionResult:
@@ -363,9 +364,11 @@ class GPUProcessor(BaseProcessor):
         Returns:
             GPUConversionResult with extracted content
         """
+        # Page images for this document share one scratch directory, removed in one pass
+        image_dir = tempfile.mkdtemp(prefix='docstrange_pages_')
         try:
             # Convert PDF to images
-            image_paths = self._convert_pdf_to_images(file_path)
+            image_paths = self._convert_pdf_to_images(file_path, image_dir)
             
             if not image_paths:
                 logger.warning("No pages could be extracted from PDF")
@@ -415,13 +418,6 @@ class GPUProcessor(BaseProcessor):
                     all_texts.append(f"\n## Page {i+1}\n\n*Error processing this page: {e}*\n\n")
                     if i < len(image_paths) - 1:
                         all_texts.append("---\n\n")
-                
-                finally:
-                    # Clean up temporary image file
-                    try:
-                        os.unlink(image_path)
-                    except:
-                        pass
             
             # Combine all page texts
             combined_text = ''.join(all_texts)
@@ -448,15 +444,18 @@ class GPUProcessor(BaseProcessor):
         except Exception as e:
             logger.error(f"Failed to process PDF {file_path}: {e}")
             raise ConversionError(f"PDF processing failed: {e}")
+        finally:
+            shutil.rmtree(image_dir, ignore_errors=True)
     
-    def _convert_pdf_to_images(self, pdf_path: str) -> List[str]:
+    def _convert_pdf_to_images(self, pdf_path: str, output_dir: str) -> List[str]:
         """Convert PDF pages to images.
         
         Args:
             pdf_path: Path to the PDF file
+            output_dir: Directory to write the page images into
             
         Returns:
-            List of paths to temporary image files
+            List of paths to the page image files, in page order
         """
         try:
             from pdf2image import convert_from_path
@@ -465,15 +464,9 @@ class GPUProcessor(BaseProcessor):
             # Get DPI from config
             dpi = getattr(InternalConfig, 'pdf_image_dpi', 300)
             
-            # Convert PDF pages to images using pdf2image
-            images = convert_from_path(pdf_path, dpi=dpi)
-            image_paths = []
-            
-            # Save each image to a temporary file
-            for page_num, image in enumerate(images):
-                persistent_image_path = tempfile.mktemp(suffix='.png')
-                image.save(persistent_image_path, 'PNG')
-                image_paths.append(persistent_image_path)
+            # Let poppler write the pages straight to disk instead of decoding
+            # them into memory and re-encoding each one
+            image_paths = convert_from_path(pdf_path, dpi=dpi, output_folder=output_dir, fmt='png', paths_only=True)
             
             logger.info(f"Converted PDF to {len(image_paths)} images")
             return image_paths
@@ -487,13 +480,15 @@ class GPUProcessor(BaseProcessor):
     
     @staticmethod
     def predownload_ocr_models():
-        """Pre-download OCR models by running a dummy prediction."""
+        """Pre-download OCR models by running a dummy prediction.
+        
+        Loads the process-wide Nanonets service that requests use, so calling this
+        at startup also moves the model load and first inference off the first request.
+        """
         try:
-            from docstrange.pipeline.ocr_service import OCRServiceFactory
-            ocr_service = OCRServiceFactory.create_service('nanonets')
+            ocr_service = get_shared_ocr_service('nanonets')
             # Create a blank image for testing
             from PIL import Image
-            import tempfile
             with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
                 img = Image.new('RGB', (100, 100), color='white')
                 img.save(tmp.name)
@@ -2,12 +2,13 @@
 
 import os
 import logging
+import tempfile
 from typing import Dict, Any
 
 from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
-from ..pipeline.ocr_service import OCRServiceFactory
+from ..pipeline.ocr_service import get_shared_ocr_service
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -41,7 +42,7 @@ class ImageProcessor(BaseProcessor):
         """Get OCR service instance."""
         if self._ocr_service is not None:
             return self._ocr_service
-        self._ocr_service = OCRServiceFactory.create_service()
+        self._ocr_service = get_shared_ocr_service()
         return self._ocr_service
     
     def process(self, file_path: str) -> ConversionResult:
@@ -95,11 +96,9 @@ class ImageProcessor(BaseProcessor):
     def predownload_ocr_models():
         """Pre-download OCR models by running a dummy prediction."""
         try:
-            from docstrange.services.ocr_service import OCRServiceFactory
-            ocr_service = OCRServiceFactory.create_service()
+            ocr_service = get_shared_ocr_service()
             # Create a blank image for testing
             from PIL import Image
-            import tempfile
             with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
                 img = Image.new('RGB', (100, 100), color='white')
                 img.save(tmp.name)
@@ -1,28 +1,268 @@
 """PDF file processor with OCR support for scanned PDFs."""
 
 import os
+import io
+import re
+import atexit
+import hashlib
 import logging
 import tempfile
-from typing import Dict, Any, List, Tuple
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple
 
 from .base import BaseProcessor
 from .image_processor import ImageProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, FileNotFoundError
 from ..config import InternalConfig
-from ..pipeline.ocr_service import OCRServiceFactory, NeuralOCRService
+from ..pipeline.ocr_service import get_shared_ocr_service
+from ..utils.temp_utils import get_fast_temp_dir
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Persistent OCR worker pool shared by all PDFProcessor instances
+_ocr_pool = None
+_ocr_pool_workers = 0
+_ocr_pool_lock = threading.Lock()
+
+# Torch threads per OCR worker process, set by the pool initializer
+_worker_threads = None
+
+# OCR output of recently seen page images, keyed by image content hash and
+# processor options, so repeated pages (blank pages, boilerplate) are OCR'd once
+_PAGE_CACHE_SIZE = 512
+_page_cache = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+# Matches pdfinfo's "Page size" value, e.g. "612 x 792 pts (letter)"
+_PAGE_SIZE_RE = re.compile(r'([\d.]+)\s*x\s*([\d.]+)\s*pts')
+
+# Pages whose short side is below this (in points) are treated as small-print formats
+_SMALL_PAGE_POINTS = 360
+
+# OCR section of an ImageProcessor result, up to the next markdown header
+_OCR_SECTION_RE = re.compile(r'## Extracted Text \(OCR\)(?:\n+|\Z)(.*?)(?:^##|\Z)', re.DOTALL | re.MULTILINE)
+
+# Page image formats pdf2image can render directly; others fall back to PNG
+_INTERMEDIATE_FORMATS = ('JPEG', 'JPG', 'PNG', 'TIFF')
+
+# Text layer density (non-whitespace chars per page) above which a PDF is treated as born-digital
+_MIN_TEXT_LAYER_CHARS = 200
+
+# Number of leading pages sampled to decide whether the text layer is usable
+_TEXT_LAYER_PROBE_PAGES = 3
+
+# Pages of a born-digital PDF with less text than this are OCR'd, so scans that
+# only carry a digital page number or Bates stamp are not reduced to the stamp
+_MIN_PAGE_TEXT_CHARS = 50
+
+
+def _table_to_markdown(rows: List[List[Optional[str]]]) -> str:
+    """Render rows extracted from a PDF table as a markdown table.
+    
+    Args:
+        rows: Table rows, the first being the header; empty cells may be None
+        
+    Returns:
+        Markdown table
+    """
+    cells = [[' '.join((cell or '').split()) for cell in row] for row in rows]
+    lines = ["| " + " | ".join(cells[0]) + " |", "| " + " | ".join(["---"] * len(cells[0])) + " |"]
+    lines.extend("| " + " | ".join(row) + " |" for row in cells[1:])
+    return "\n".join(lines)
+
+
+def _resolve_ocr_workers() -> int:
+    """Resolve the number of OCR worker processes from the internal config.
+    
+    Returns:
+        Number of worker processes (1 means OCR runs in-process)
+    """
+    workers = getattr(InternalConfig, 'pdf_ocr_workers', 1)
+    if workers is None:
+        # Each neural OCR service already runs its models with 4 threads
+        workers = min(4, (os.cpu_count() or 1) // 4)
+    return max(1, int(workers))
+
+
+def _get_ocr_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared OCR worker pool, creating it on first use.
+    
+    Args:
+        workers: Number of worker processes
+        
+    Returns:
+        ProcessPoolExecutor reused across PDFProcessor calls
+    """
+    global _ocr_pool, _ocr_pool_workers
+    with _ocr_pool_lock:
+        if _ocr_pool is None or _ocr_pool_workers != workers:
+            if _ocr_pool is not None:
+                _ocr_pool.shutdown(wait=False)
+            # Spawn instead of fork so workers never inherit torch/OCR thread state
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_ocr_worker,
+                initargs=(max(1, (os.cpu_count() or 1) // workers),)
+            )
+            _ocr_pool_workers = workers
+            logger.info(f"Started PDF OCR worker pool with {workers} processes")
+        return _ocr_pool
+
+
+def _discard_ocr_pool(pool: ProcessPoolExecutor):
+    """Drop a broken OCR worker pool so the next _get_ocr_pool call starts a fresh one.
+    
+    Args:
+        pool: The pool that failed
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is pool:
+            _ocr_pool = None
+    pool.shutdown(wait=False)
+
+
+def _init_ocr_worker(threads: int):
+    """Limit the math library thread pools of an OCR worker process.
+    
+    Runs before the worker imports torch, so each worker's OpenMP/MKL pools get
+    a share of the cores instead of every worker claiming all of them. The
+    table model sets its own torch thread count when it loads, so
+    _ocr_page_batch applies the share again after the OCR service is created.
+    
+    Args:
+        threads: Threads per worker
+    """
+    global _worker_threads
+    _worker_threads = threads
+    for var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ.setdefault(var, str(threads))
+
+
+def _shutdown_ocr_pool():
+    """Shut down the shared OCR worker pool at interpreter exit."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=False)
+            _ocr_pool = None
+
+
+atexit.register(_shutdown_ocr_pool)
+
+
+def _select_dpi(pdf_info: Dict[str, Any]) -> int:
+    """Pick the rasterization DPI for a PDF from its first page size.
+    
+    Args:
+        pdf_info: Output of pdf2image's pdfinfo_from_path
+        
+    Returns:
+        DPI to render pages at
+    """
+    dpi = getattr(InternalConfig, 'pdf_ocr_image_dpi', 200)
+    match = _PAGE_SIZE_RE.search(str(pdf_info.get('Page size', '')))
+    if not match:
+        return dpi
+    
+    width_pts, height_pts = float(match.group(1)), float(match.group(2))
+    if min(width_pts, height_pts) < _SMALL_PAGE_POINTS:
+        # Receipts and labels tend to carry small print that needs more pixels
+        dpi = getattr(InternalConfig, 'pdf_image_dpi_small_text', 300)
+    
+    # Keep large-format pages (drawings, posters) from producing huge rasters
+    max_size = getattr(InternalConfig, 'pdf_image_max_size', None)
+    long_side_pts = max(width_pts, height_pts)
+    if max_size and long_side_pts > 0:
+        dpi = min(dpi, int(max_size * 72 / long_side_pts))
+    
+    return max(dpi, 1)
+
+
+def _get_cached_page(key: Tuple) -> Optional[str]:
+    """Look up cached OCR output for a page image.
+    
+    Args:
+        key: Page cache key
+        
+    Returns:
+        Cached page content, or None on a miss
+    """
+    with _page_cache_lock:
+        content = _page_cache.get(key)
+        if content is not None:
+            _page_cache.move_to_end(key)
+        return content
+
+
+def _cache_page(key: Tuple, content: str):
+    """Store OCR output for a page image, evicting the least recently used entry.
+    
+    Args:
+        key: Page cache key
+        content: Extracted page content
+    """
+    with _page_cache_lock:
+        _page_cache[key] = content
+        _page_cache.move_to_end(key)
+        if len(_page_cache) > _PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+
+
+def _ocr_page_batch(task: Tuple[List[Tuple[str, int]], bool, bool, bool, bool]) -> List[Tuple[int, str]]:
+    """OCR a batch of PDF page images inside a pool worker process.
+    
+    Args:
+        task: Tuple of (pages, preserve_layout, include_images, ocr_enabled,
+            use_markdownify), where pages holds (image_path, page_index) tuples
+        
+    Returns:
+        List of (page_index, page_content) tuples
+    """
+    pages, preserve_layout, include_images, ocr_enabled, use_markdownify = task
+    
+    # Loaded on the first batch this worker receives and kept for the worker's lifetime
+    ocr_service = get_shared_ocr_service('neural')
+    if _worker_threads:
+        # TFPredictor calls torch.set_num_threads(4) on load, overriding OMP_NUM_THREADS
+        import torch
+        if torch.get_num_threads() != _worker_threads:
+            torch.set_num_threads(_worker_threads)
+    
+    image_processor = ImageProcessor(
+        preserve_layout=preserve_layout,
+        include_images=include_images,
+        ocr_enabled=ocr_enabled,
+        use_markdownify=use_markdownify,
+        ocr_service=ocr_service
+    )
+    return [
+        (page_index, image_processor.process(image_path).content)
+        for image_path, page_index in pages
+    ]
+
 
 class PDFProcessor(BaseProcessor):
     """Processor for PDF files using PDF-to-image conversion with OCR."""
     
     def __init__(self, preserve_layout: bool = True, include_images: bool = False, ocr_enabled: bool = True, use_markdownify: bool = None):
         super().__init__(preserve_layout, include_images, ocr_enabled, use_markdownify)
-        # Create a shared OCR service instance for all pages
-        shared_ocr_service = NeuralOCRService()
+        self._ocr_workers = _resolve_ocr_workers()
+        self._intermediate_format = self._resolve_intermediate_format()
+        if self._ocr_workers > 1:
+            # Pages are OCR'd by the worker pool, which loads its own OCR models
+            _get_ocr_pool(self._ocr_workers)
+            shared_ocr_service = None
+        else:
+            # Reuse the process-wide OCR service so models load once, not per processor
+            shared_ocr_service = get_shared_ocr_service('neural')
         self._image_processor = ImageProcessor(
             preserve_layout=preserve_layout,
             include_images=include_images,
@@ -31,6 +271,21 @@ class PDFProcessor(BaseProcessor):
             ocr_service=shared_ocr_service
         )
     
+    def _resolve_intermediate_format(self) -> str:
+        """Get the image format used for page images handed to OCR.
+        
+        Returns:
+            Upper-case format name, one of _INTERMEDIATE_FORMATS
+        """
+        if self.include_images:
+            # Keep page images lossless when they may end up in the output
+            return 'PNG'
+        fmt = str(getattr(InternalConfig, 'pdf_intermediate_format', 'JPEG')).upper()
+        if fmt not in _INTERMEDIATE_FORMATS:
+            logger.warning(f"Unsupported pdf_intermediate_format {fmt!r}, using PNG (supported: JPEG, PNG, TIFF)")
+            return 'PNG'
+        return fmt
+    
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file.
         
@@ -72,7 +327,12 @@ class PDFProcessor(BaseProcessor):
             logger.info(f"Processing PDF file: {file_path}")
             logger.info(f"pdf_to_image_enabled = {pdf_to_image_enabled}")
             
-            # Always use OCR-based processing (pdf2image + OCR)
+            # Born-digital PDFs already carry their text; only scanned ones need OCR
+            if getattr(InternalConfig, 'pdf_fast_text_extract', True):
+                result = self._process_with_text_layer(file_path)
+                if result is not None:
+                    return result
+            
             logger.info("Using OCR-based PDF processing with pdf2image")
             return self._process_with_ocr(file_path)
             
@@ -80,39 +340,187 @@ class PDFProcessor(BaseProcessor):
             logger.error(f"Failed to process PDF file {file_path}: {e}")
             raise ConversionError(f"PDF processing failed: {e}")
     
+    def _process_with_text_layer(self, file_path: str) -> Optional[ConversionResult]:
+        """Extract the embedded text layer of a born-digital PDF with PyMuPDF.
+        
+        Pages with little or no embedded text (e.g. scans attached to a typed
+        letter) are rendered and OCR'd individually.
+        
+        Args:
+            file_path: Path to the PDF file
+            
+        Returns:
+            ConversionResult with the extracted text, or None if PyMuPDF is not
+            installed or the PDF does not have a usable text layer
+        """
+        try:
+            import fitz
+        except ImportError:
+            logger.debug("PyMuPDF not available, skipping text layer extraction")
+            return None
+        
+        try:
+            with fitz.open(file_path) as doc:
+                page_count = doc.page_count
+                if page_count == 0:
+                    return None
+                
+                probe_count = min(_TEXT_LAYER_PROBE_PAGES, page_count)
+                probe_texts = [doc[page_num].get_text("text") for page_num in range(probe_count)]
+                text_chars = sum(len(''.join(text.split())) for text in probe_texts)
+                if text_chars / probe_count < _MIN_TEXT_LAYER_CHARS:
+                    logger.info("PDF has no usable text layer, falling back to OCR")
+                    return None
+                
+                page_texts = [self._page_text(doc[page_num]) for page_num in range(page_count)]
+                
+                # Page sizes of pages without a usable text layer, needed to render them for OCR
+                untexted_pages = {
+                    page_num: (doc[page_num].rect.width, doc[page_num].rect.height)
+                    for page_num, text in enumerate(page_texts)
+                    if len(''.join(text.split())) < _MIN_PAGE_TEXT_CHARS
+                }
+        except Exception as e:
+            logger.warning(f"Text layer extraction failed, falling back to OCR: {e}")
+            return None
+        
+        ocr_texts = {}
+        if untexted_pages and self.ocr_enabled:
+            try:
+                ocr_texts = self._ocr_untexted_pages(file_path, untexted_pages)
+            except Exception as e:
+                logger.warning(f"OCR of pages without a text layer failed, falling back to full OCR: {e}")
+                return None
+        
+        logger.info(f"Using embedded PDF text layer ({len(ocr_texts)} of {page_count} pages OCR'd)")
+        all_content = []
+        for page_num, text in enumerate(page_texts):
+            text = ocr_texts.get(page_num, text).strip()
+            if text:
+                all_content.append(f"## Page {page_num + 1}\n\n{text}")
+        
+        return ConversionResult(
+            content="\n\n".join(all_content),
+            metadata={
+                'file_path': file_path,
+                'file_type': 'pdf',
+                'pages': page_count,
+                'extraction_method': 'text_layer',
+                'ocr_pages': sorted(ocr_texts)
+            }
+        )
+    
+    def _page_text(self, page) -> str:
+        """Get the text layer of a PyMuPDF page in reading order.
+        
+        With preserve_layout, tables on the page are rendered as markdown tables
+        in place of their cell text.
+        
+        Args:
+            page: PyMuPDF page
+            
+        Returns:
+            Page text
+        """
+        if not self.preserve_layout:
+            return page.get_text("text", sort=True)
+        
+        tables = page.find_tables().tables
+        if not tables:
+            return page.get_text("text", sort=True)
+        
+        # (top, text) of each table and each text block outside the tables
+        table_boxes = [table.bbox for table in tables]
+        parts = [(table.bbox[1], _table_to_markdown(table.extract())) for table in tables]
+        for x0, y0, x1, y1, text, _, block_type in page.get_text("blocks", sort=True):
+            if block_type != 0:
+                continue
+            center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+            if any(tx0 <= center_x <= tx1 and ty0 <= center_y <= ty1 for tx0, ty0, tx1, ty1 in table_boxes):
+                # Cell text is already part of the table's markdown
+                continue
+            parts.append((y0, text.strip()))
+        
+        parts.sort(key=lambda part: part[0])
+        return "\n\n".join(text for _, text in parts if text)
+    
+    def _ocr_untexted_pages(self, file_path: str, page_sizes: Dict[int, Tuple[float, float]]) -> Dict[int, str]:
+        """Render and OCR individual pages of an otherwise born-digital PDF.
+        
+        Args:
+            file_path: Path to the PDF file
+            page_sizes: Page width and height in points, keyed by 0-based page index
+            
+        Returns:
+            OCR'd page content keyed by 0-based page index
+        """
+        from pdf2image import convert_from_path
+        
+        ocr_texts = {}
+        with tempfile.TemporaryDirectory(dir=get_fast_temp_dir()) as scratch_dir:
+            for page_num, (width_pts, height_pts) in sorted(page_sizes.items()):
+                page_paths = convert_from_path(
+                    file_path,
+                    dpi=_select_dpi({'Page size': f"{width_pts} x {height_pts} pts"}),
+                    first_page=page_num + 1,
+                    last_page=page_num + 1,
+                    output_folder=scratch_dir,
+                    paths_only=True,
+                    **self._raster_options()
+                )
+                try:
+                    ocr_texts.update(self._ocr_pages(page_paths, page_num))
+                finally:
+                    for page_path in page_paths:
+                        os.unlink(page_path)
+        return ocr_texts
+    
     def _process_with_ocr(self, file_path: str) -> ConversionResult:
         """Process PDF using OCR after converting pages to images."""
         try:
-            from pdf2image import convert_from_path
+            from pdf2image import convert_from_path, pdfinfo_from_path
             from ..config import InternalConfig
             
-            # Get DPI from config
-            dpi = getattr(InternalConfig, 'pdf_image_dpi', 300)
+            pdf_info = pdfinfo_from_path(file_path)
+            page_count = pdf_info['Pages']
+            dpi = _select_dpi(pdf_info)
+            # Pages are appended to one growing buffer instead of joining a list of page strings
+            content_buffer = io.StringIO()
             
-            # Convert PDF pages to images using pdf2image
-            images = convert_from_path(file_path, dpi=dpi)
-            page_count = len(images)
-            all_content = []
+            # Poppler writes the encoded page images itself, so no PIL decode/encode
+            # pass is needed before OCR; thread_count splits each batch across
+            # several pdftoppm processes
+            raster_threads = max(1, min(8, (os.cpu_count() or 1) // self._ocr_workers))
+            ocr_batch_size = max(1, getattr(InternalConfig, 'pdf_ocr_batch_size', 8))
+            batch_size = max(self._ocr_workers * ocr_batch_size, raster_threads)
             
-            for page_num, image in enumerate(images):
-                # Save to temporary file for OCR processing
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    image.save(tmp.name, 'PNG')
-                    temp_image_path = tmp.name
-                
-                try:
-                    # Process the page image
-                    page_result = self._image_processor.process(temp_image_path)
-                    page_content = page_result.content
+            with tempfile.TemporaryDirectory(dir=get_fast_temp_dir()) as scratch_dir:
+                for first_page in range(1, page_count + 1, batch_size):
+                    last_page = min(first_page + batch_size - 1, page_count)
+                    page_paths = convert_from_path(
+                        file_path,
+                        dpi=dpi,
+                        first_page=first_page,
+                        last_page=last_page,
+                        output_folder=scratch_dir,
+                        paths_only=True,
+                        thread_count=min(raster_threads, last_page - first_page + 1),
+                        **self._raster_options()
+                    )
                     
-                    if page_content.strip():
-                        all_content.append(f"## Page {page_num + 1}\n\n{page_content}")
-                    
-                finally:
-                    # Clean up temporary file
-                    os.unlink(temp_image_path)
+                    try:
+                        for page_num, page_content in self._ocr_pages(page_paths, first_page - 1):
+                            if page_content.strip():
+                                if content_buffer.tell():
+                                    content_buffer.write("\n\n")
+                                content_buffer.write(f"## Page {page_num + 1}\n\n")
+                                content_buffer.write(page_content)
+                    finally:
+                        # Release each batch's page images before rendering the next one
+                        for page_path in page_paths:
+                            os.unlink(page_path)
             
-            content = "\n\n".join(all_content) if all_content else "No content extracted from PDF"
+            content = content_buffer.getvalue() or "No content extracted from PDF"
             
             return ConversionResult(
                 content=content,
@@ -131,39 +539,93 @@ class PDFProcessor(BaseProcessor):
             logger.error(f"OCR-based PDF processing failed: {e}")
             raise ConversionError(f"OCR-based PDF processing failed: {e}")
     
-    def _convert_page_to_image(self, pdf_path: str, page_num: int) -> str:
-        """Convert a PDF page to an image file.
+    def _raster_options(self) -> Dict[str, Any]:
+        """Get pdf2image output options matching the intermediate image format.
+        
+        Returns:
+            Keyword arguments for convert_from_path
+        """
+        if self._intermediate_format in ('JPEG', 'JPG'):
+            return {'fmt': 'jpeg', 'jpegopt': {'quality': 92, 'progressive': False, 'optimize': False}}
+        if self._intermediate_format == 'TIFF':
+            return {'fmt': 'tiff'}
+        return {'fmt': 'png'}
+    
+    def _ocr_pages(self, page_paths: List[str], start_index: int = 0) -> List[Tuple[int, str]]:
+        """OCR page images, skipping pages whose image was already OCR'd.
         
         Args:
-            pdf_path: Path to the PDF file
-            page_num: Page number (0-based)
+            page_paths: Image files of consecutive PDF pages, in page order
+            start_index: 0-based page index of the first image
             
         Returns:
-            Path to the temporary image file
+            List of (page_index, page_content) tuples sorted by page index
         """
-        try:
-            from pdf2image import convert_from_path
-            from ..config import InternalConfig
-            
-            # Use configuration for image quality
-            dpi = getattr(InternalConfig, 'pdf_image_dpi', 300)
-            
-            # Convert specific page to image
-            images = convert_from_path(pdf_path, dpi=dpi, first_page=page_num + 1, last_page=page_num + 1)
-            
-            if not images:
-                logger.error(f"Failed to extract page {page_num + 1} to image")
-                return None
+        options = (self.preserve_layout, self.include_images, self.ocr_enabled, self.use_markdownify)
+        page_keys = []
+        known = {}
+        pending = {}  # cache key -> first page image with that content
+        
+        for page_path in page_paths:
+            with open(page_path, 'rb') as page_file:
+                digest = hashlib.blake2b(page_file.read(), digest_size=16).digest()
+            key = (digest,) + options
+            page_keys.append(key)
+            if key in known or key in pending:
+                continue
+            content = _get_cached_page(key)
+            if content is not None:
+                known[key] = content
+            else:
+                pending[key] = page_path
+        
+        if pending:
+            logger.debug(f"OCR for {len(pending)} of {len(page_paths)} pages, rest are duplicates")
+            for key, content in zip(pending, self._ocr_page_files(list(pending.values()))):
+                if content:
+                    # Empty output may be an OCR failure, so only dedupe it within this document
+                    _cache_page(key, content)
+                known[key] = content
+        
+        return [(page_num, known[key]) for page_num, key in enumerate(page_keys, start_index)]
+    
+    def _ocr_page_files(self, page_paths: List[str]) -> List[str]:
+        """OCR page images, in parallel when a worker pool is configured.
+        
+        Args:
+            page_paths: Image files to OCR
             
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                images[0].save(tmp_file.name, 'PNG')
-                logger.debug(f"Page {page_num + 1} converted to image: {tmp_file.name}")
-                return tmp_file.name
-                
-        except Exception as e:
-            logger.error(f"Failed to extract page {page_num + 1} to image: {e}")
-            return None
+        Returns:
+            Page contents in the same order as page_paths
+        """
+        if self._ocr_workers <= 1:
+            return [self._image_processor.process(page_path).content for page_path in page_paths]
+        
+        # Workers open the page images straight from the (tmpfs) scratch directory,
+        # so only paths cross the process boundary instead of pickled image data
+        pages = [(page_path, page_index) for page_index, page_path in enumerate(page_paths)]
+        
+        # One task per worker per batch keeps IPC round trips per page to a minimum
+        chunk_size = -(-len(pages) // self._ocr_workers)
+        tasks = [
+            (pages[i:i + chunk_size], self.preserve_layout, self.include_images, self.ocr_enabled, self.use_markdownify)
+            for i in range(0, len(pages), chunk_size)
+        ]
+        
+        for attempt in range(2):
+            pool = _get_ocr_pool(self._ocr_workers)
+            try:
+                results = []
+                for batch_results in pool.map(_ocr_page_batch, tasks):
+                    results.extend(batch_results)
+                return [content for _, content in sorted(results)]
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM while loading models); without a rebuild every
+                # later PDF in this process would fail on the same dead pool
+                _discard_ocr_pool(pool)
+                if attempt:
+                    raise
+                logger.warning("PDF OCR worker pool broke, restarting it and retrying the batch")
     
     def _extract_ocr_text_from_result(self, result: ConversionResult) -> str:
         """Extract OCR text from ImageProcessor result.
@@ -177,27 +639,10 @@ class PDFProcessor(BaseProcessor):
         try:
             content = result.content
             
-            # Look for OCR section in the content
-            if "## Extracted Text (OCR)" in content:
-                # Extract text after the OCR header
-                parts = content.split("## Extracted Text (OCR)")
-                if len(parts) > 1:
-                    ocr_section = parts[1]
-                    # Remove any remaining headers and clean up
-                    lines = ocr_section.split('\n')
-                    text_lines = []
-                    in_ocr_text = False
-                    
-                    for line in lines:
-                        if line.strip() == "":
-                            continue
-                        elif line.startswith("##"):
-                            # Stop at next header
-                            break
-                        else:
-                            text_lines.append(line)
-                    
-                    return '\n'.join(text_lines).strip()
+            # Take the text after the OCR header, up to the next header
+            match = _OCR_SECTION_RE.search(content)
+            if match:
+                return match.group(1).strip()
             
             # If no OCR section found, return the full content
             return content
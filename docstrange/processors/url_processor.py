@@ -3,6 +3,7 @@
 import os
 import re
 import tempfile
+import threading
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 
@@ -10,6 +11,37 @@ from .base import BaseProcessor
 from ..result import ConversionResult
 from ..exceptions import ConversionError, NetworkError
 
+# Read size for streamed downloads; large blocks keep syscall and Python loop
+# overhead low while bounding memory to a single chunk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Keep-alive session shared by URL fetches, so the content-type HEAD probe and
+# the following download reuse one connection to the host
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Get the shared HTTP session for URL fetches.
+    
+    Returns:
+        requests.Session with pooled keep-alive adapters
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import http.cookiejar
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            _session = requests.Session()
+            # Fetches for different callers share the session, so never keep their cookies
+            _session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
 
 class URLProcessor(BaseProcessor):
     """Processor for URLs and web pages."""
@@ -117,7 +149,7 @@ class URLProcessor(BaseProcessor):
                 }
                 
                 # Make a HEAD request to check content-type
-                response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+                response = _get_session().head(url, headers=headers, timeout=10, allow_redirects=True)
                 
                 if response.status_code == 200:
                     content_type = response.headers.get('content-type', '').lower()
@@ -177,7 +209,6 @@ class URLProcessor(BaseProcessor):
             ConversionResult containing the processed content
         """
         try:
-            import requests
             from ..extractor import DocumentExtractor
             
             # Download the file
@@ -185,14 +216,14 @@ class URLProcessor(BaseProcessor):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=60, stream=True)
+            response = _get_session().get(url, headers=headers, timeout=60, stream=True)
             response.raise_for_status()
             
             # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_info['extension']) as temp_file:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=file_info['extension'], buffering=_DOWNLOAD_CHUNK_SIZE) as temp_file:
                 # Write the downloaded content and track size
                 content_length = 0
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                     if chunk:  # Filter out keep-alive chunks
                         temp_file.write(chunk)
                         content_length += len(chunk)
@@ -235,14 +266,13 @@ class URLProcessor(BaseProcessor):
         """
         try:
             from bs4 import BeautifulSoup
-            import requests
             
             # Fetch the web page
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _get_session().get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Parse the HTML
@@ -954,8 +954,8 @@ class ConversionResult:
             # If specific fields or schema are requested, use Ollama extraction
             if specified_fields or json_schema:
                 try:
-                    from docstrange.services import OllamaFieldExtractor
-                    extractor = OllamaFieldExtractor(base_url=ollama_url, model=ollama_model)
+                    from docstrange.services import get_ollama_extractor
+                    extractor = get_ollama_extractor(ollama_url, ollama_model)
                     
                     if extractor.is_available():
                         if specified_fields:
@@ -983,8 +983,8 @@ class ConversionResult:
             
             # For general JSON conversion, try Ollama first for better document understanding
             try:
-                from docstrange.services import OllamaFieldExtractor
-                extractor = OllamaFieldExtractor(base_url=ollama_url, model=ollama_model)
+                from docstrange.services import get_ollama_extractor
+                extractor = get_ollama_extractor(ollama_url, ollama_model)
                 
                 if extractor.is_available():
                     # Ask Ollama to extract the entire document to structured JSON
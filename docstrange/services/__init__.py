@@ -1,5 +1,5 @@
 """Services for local LLM processing."""
 
-from .ollama_service import OllamaFieldExtractor
+from .ollama_service import OllamaFieldExtractor, get_ollama_extractor
 
-__all__ = ["OllamaFieldExtractor"] 
\ No newline at end of file
+__all__ = ["OllamaFieldExtractor", "get_ollama_extractor"] 
\ No newline at end of file
@@ -321,6 +321,7 @@ class AuthService:
         self.server_thread = None
         self.auth_complete = False
         self.auth_success = False
+        self.auth_event = threading.Event()  # Set by the callback handler when auth finishes
         
         # Ensure cache directory exists
         self.cache_dir.mkdir(exist_ok=True)
@@ -455,6 +456,9 @@ class AuthService:
             self.state = str(uuid.uuid4())
             
             # Start callback server
+            self.auth_complete = False
+            self.auth_success = False
+            self.auth_event.clear()
             callback_url = self._start_callback_server()
             
             # Build Auth0 authorization URL with Google connection
@@ -485,12 +489,10 @@ class AuthService:
                 logger.warning(f"Could not open browser automatically: {e}")
                 print("Please manually open the link above in your browser.")
             
-            # Wait for authentication to complete
+            # Wait for the callback handler to signal completion
             timeout = 300  # 5 minutes
             start_time = time.time()
-            
-            while not self.auth_complete and (time.time() - start_time) < timeout:
-                time.sleep(0.5)
+            self.auth_event.wait(timeout)
             
             # Stop the server
             self._stop_callback_server()
@@ -570,22 +572,26 @@ class AuthService:
                 
                 self.auth_complete = True
                 self.auth_success = True
+                self.auth_event.set()
                 return True
             else:
                 logger.error(f"Auth0 token exchange failed: {response.status_code} {response.text}")
                 self.auth_complete = True
                 self.auth_success = False
+                self.auth_event.set()
                 return False
             
         except ImportError:
             logger.error("requests library is required for authentication")
             self.auth_complete = True
             self.auth_success = False
+            self.auth_event.set()
             return False
         except Exception as e:
             logger.error(f"Auth0 token exchange failed: {e}")
             self.auth_complete = True
             self.auth_success = False
+            self.auth_event.set()
             return False
     
     def _get_user_info(self, access_token: str) -> dict:
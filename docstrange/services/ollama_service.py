@@ -1,11 +1,20 @@
 """Ollama service for local field extraction from markdown content."""
 
+import functools
 import json
 import logging
+import socket
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Connect timeout for the liveness probe run before talking to the Ollama API
+_PROBE_TIMEOUT = 0.5
+
+# Hosts that never need the proxy settings from the environment
+_LOOPBACK_HOSTS = frozenset(["localhost", "127.0.0.1", "::1"])
+
 
 class OllamaFieldExtractor:
     """Service for extracting structured data from markdown using local Ollama models."""
@@ -19,6 +28,7 @@ class OllamaFieldExtractor:
         """
         self.base_url = base_url
         self.model = model
+        self._parsed_url = urlparse(base_url if "://" in base_url else f"http://{base_url}")
         self._client = None
         self._is_available = None
     
@@ -27,7 +37,10 @@ class OllamaFieldExtractor:
         if self._client is None:
             try:
                 import ollama
-                self._client = ollama.Client(host=self.base_url)
+                # A local server is reached directly: skip HTTP(S)_PROXY/NO_PROXY lookups,
+                # which would otherwise be consulted (or misroute) on every request
+                local = self._parsed_url.hostname in _LOOPBACK_HOSTS
+                self._client = ollama.Client(host=self.base_url, trust_env=not local)
             except ImportError:
                 raise ImportError(
                     "ollama is required for local field extraction. "
@@ -35,14 +48,40 @@ class OllamaFieldExtractor:
                 )
         return self._client
     
+    def _server_reachable(self) -> bool:
+        """Check that something accepts TCP connections at the Ollama URL.
+        
+        Much cheaper than an API round-trip, and fails fast when no server is running.
+        Only meaningful for loopback hosts: remote servers may only be reachable
+        through the proxy environment, which a raw socket does not use.
+        
+        Returns:
+            True if a TCP connection to the server could be opened
+        """
+        parsed = self._parsed_url
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        try:
+            with socket.create_connection((parsed.hostname or "localhost", port), timeout=_PROBE_TIMEOUT):
+                return True
+        except OSError:
+            return False
+    
     def is_available(self) -> bool:
         """Check if Ollama service is available.
         
         Returns:
             True if Ollama is available and responding
         """
-        if self._is_available is not None:
-            return self._is_available
+        # Only success is remembered: extractors are shared, and a server that was
+        # down earlier may have been started since (re-probing it is cheap)
+        if self._is_available:
+            return True
+        
+        local = self._parsed_url.hostname in _LOOPBACK_HOSTS
+        if local and not self._server_reachable():
+            self._is_available = False
+            logger.warning(f"Ollama service not available: nothing listening at {self.base_url}")
+            return False
         
         try:
             client = self._get_client()
@@ -297,4 +336,21 @@ JSON:"""
             
         except Exception as e:
             logger.error(f"Document JSON conversion failed: {e}")
-            raise ValueError(f"Failed to extract document to JSON: {e}") 
\ No newline at end of file
+            raise ValueError(f"Failed to extract document to JSON: {e}") 
+
+
+@functools.lru_cache(maxsize=8)
+def get_ollama_extractor(base_url: str = "http://localhost:11434", model: str = "llama3.2") -> OllamaFieldExtractor:
+    """Get the shared field extractor for an Ollama server and model.
+    
+    Results converted one after another usually ask for the same server and model,
+    so they share one extractor, its HTTP client and its model availability check.
+    
+    Args:
+        base_url: Ollama server URL
+        model: Model name to use
+        
+    Returns:
+        OllamaFieldExtractor reused across calls with the same arguments
+    """
+    return OllamaFieldExtractor(base_url=base_url, model=model)
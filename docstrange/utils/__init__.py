@@ -1,15 +1,21 @@
 """Utility functions for the LLM extractor."""
 
 from .gpu_utils import (
+    CudaProbe,
+    probe_cuda,
     is_gpu_available,
     get_gpu_info,
     should_use_gpu_processor,
     get_processor_preference
 )
+from .temp_utils import get_fast_temp_dir
 
 __all__ = [
+    "CudaProbe",
+    "probe_cuda",
     "is_gpu_available",
     "get_gpu_info", 
     "should_use_gpu_processor",
-    "get_processor_preference"
+    "get_processor_preference",
+    "get_fast_temp_dir"
 ] 
\ No newline at end of file
@@ -1,33 +1,60 @@
 """GPU utility functions for detecting and managing GPU availability."""
 
+import functools
 import logging
-from typing import Dict, Optional
+import os
+from typing import Dict, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def is_gpu_available() -> bool:
-    """Check if GPU is available for deep learning models.
+class CudaProbe(NamedTuple):
+    """Result of probing the CUDA driver."""
+    available: bool
+    count: int
+    name: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def probe_cuda() -> CudaProbe:
+    """Probe CUDA availability once per process.
+    
+    The first CUDA query loads the driver and creates a context, which can take
+    seconds, so the result is cached for every later caller.
     
     Returns:
-        True if GPU is available, False otherwise
+        CudaProbe with availability, device count and first device name
     """
+    if os.environ.get("CUDA_VISIBLE_DEVICES") == "":
+        # GPUs explicitly hidden - skip loading the CUDA driver entirely
+        logger.info("CUDA_VISIBLE_DEVICES is empty, assuming no GPU")
+        return CudaProbe(False, 0, None)
+    
     try:
         import torch
         if torch.cuda.is_available():
             gpu_count = torch.cuda.device_count()
             gpu_name = torch.cuda.get_device_name(0) if gpu_count > 0 else "Unknown"
             logger.info(f"GPU detected: {gpu_name} (count: {gpu_count})")
-            return True
+            return CudaProbe(True, gpu_count, gpu_name)
         else:
             logger.info("No CUDA GPU available")
-            return False
+            return CudaProbe(False, 0, None)
     except ImportError:
         logger.info("PyTorch not available, assuming no GPU")
-        return False
+        return CudaProbe(False, 0, None)
     except Exception as e:
         logger.warning(f"Error checking GPU availability: {e}")
-        return False
+        return CudaProbe(False, 0, None)
+
+
+def is_gpu_available() -> bool:
+    """Check if GPU is available for deep learning models.
+    
+    Returns:
+        True if GPU is available, False otherwise
+    """
+    return probe_cuda().available
 
 
 def get_gpu_info() -> Dict:
@@ -43,6 +70,9 @@ def get_gpu_info() -> Dict:
         "memory": []
     }
     
+    if not probe_cuda().available:
+        return info
+    
     try:
         import torch
         if torch.cuda.is_available():
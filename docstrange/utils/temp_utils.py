@@ -0,0 +1,56 @@
+"""Temporary file helpers for intermediate files handed between pipeline stages."""
+
+import logging
+import os
+import tempfile
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# RAM-backed filesystem available on most Linux hosts and containers
+SHM_DIR = "/dev/shm"
+
+# Free space SHM_DIR needs to be used; Docker's default /dev/shm is only 64 MB
+MIN_FREE_BYTES = 512 * 1024 * 1024
+
+_fast_temp_dir = None
+_fast_temp_dir_resolved = False
+
+
+def get_fast_temp_dir() -> Optional[str]:
+    """Get a RAM-backed directory for short-lived intermediate files.
+    
+    Only meant for files of bounded size (e.g. a batch of page images): tmpfs
+    counts against the container memory limit.
+    
+    Returns:
+        Path to /dev/shm when it is a writable directory with at least
+        MIN_FREE_BYTES free, otherwise None so that tempfile falls back to its
+        default directory
+    """
+    global _fast_temp_dir, _fast_temp_dir_resolved
+    if not _fast_temp_dir_resolved:
+        if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK) and _free_bytes(SHM_DIR) >= MIN_FREE_BYTES:
+            _fast_temp_dir = SHM_DIR
+            logger.debug(f"Using {SHM_DIR} for intermediate files")
+        else:
+            _fast_temp_dir = None
+            logger.debug(f"{SHM_DIR} not available or too small, using {tempfile.gettempdir()} for intermediate files")
+        _fast_temp_dir_resolved = True
+    return _fast_temp_dir
+
+
+def _free_bytes(path: str) -> int:
+    """Get the space available to unprivileged users on the filesystem of a path.
+    
+    Args:
+        path: Any path on the filesystem
+        
+    Returns:
+        Free bytes, or 0 if the filesystem cannot be queried
+    """
+    try:
+        stats = os.statvfs(path)
+    except (OSError, AttributeError):
+        return 0
+    return stats.f_bavail * stats.f_frsize
@@ -3,6 +3,9 @@
 import os
 import json
 import tempfile
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from flask import Flask, request, jsonify, render_template, send_from_directory
@@ -10,18 +13,17 @@ from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
 
 from .extractor import DocumentExtractor
+from .processors import GPUProcessor
 from .exceptions import ConversionError, UnsupportedFormatError, FileNotFoundError
+from .utils.gpu_utils import is_gpu_available
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 
 def check_gpu_availability():
     """Check if GPU is available for processing."""
-    try:
-        import torch
-        return torch.cuda.is_available()
-    except ImportError:
-        return False
+    # Cached per process, so per-request checks do not re-query the CUDA driver
+    return is_gpu_available()
 
 def download_models():
     """Download models synchronously before starting the app."""
@@ -51,6 +53,9 @@ def download_models():
     try:
         # This will trigger model downloads
         result = extractor.extract(test_file_path)
+        if gpu_available:
+            # Load the OCR model and run one inference now rather than on the first request
+            GPUProcessor.predownload_ocr_models()
         print("✅ Model download completed successfully")
     except Exception as e:
         print(f"⚠️ Model download warning: {e}")
@@ -60,13 +65,58 @@ def download_models():
         if os.path.exists(test_file_path):
             os.unlink(test_file_path)
 
+# Background model download, set when the server starts before models are ready
+_model_download = None
+
+def start_model_download() -> Future:
+    """Start downloading models in a background thread.
+    
+    Returns:
+        Future that completes when the download has finished
+    """
+    global _model_download
+    
+    def download():
+        try:
+            download_models()
+            print("✅ Models ready")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not download models: {e}")
+            print("Will proceed anyway - models will download on first use")
+    
+    if _model_download is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-download')
+        _model_download = executor.submit(download)
+        executor.shutdown(wait=False)
+    return _model_download
+
+def models_ready() -> bool:
+    """Check whether a background model download (if any) has finished."""
+    return _model_download is None or _model_download.done()
+
+# The GPU extractor holds the local processor chain and is reused across requests
+_gpu_extractor = None
+_gpu_extractor_lock = threading.Lock()
+
+# Concurrent GPU extractions; the server is threaded, and unbounded requests on
+# one model exhaust GPU memory and stretch tail latency
+_gpu_slots = threading.BoundedSemaphore(max(1, int(os.environ.get('GPU_MAX_INFLIGHT', '1'))))
+
 def create_extractor_with_mode(processing_mode):
     """Create DocumentExtractor with proper error handling for processing mode."""
+    global _gpu_extractor
     if processing_mode == 'gpu':
         if not check_gpu_availability():
             raise ValueError("GPU mode selected but GPU is not available. Please install PyTorch with CUDA support.")
-        return DocumentExtractor(gpu=True)
+        if _model_download is not None:
+            # Don't start a second download of the same models in this request
+            _model_download.result()
+        with _gpu_extractor_lock:
+            if _gpu_extractor is None:
+                _gpu_extractor = DocumentExtractor(gpu=True)
+            return _gpu_extractor
     else:  # cloud mode (default)
+        # Built per request so expired or renewed login credentials are picked up
         return DocumentExtractor()
 
 # Initialize the document extractor
@@ -106,30 +156,32 @@ def extract_document():
         
         # Save uploaded file temporarily
         with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp_file:
-            file.save(tmp_file.name)
+            file.save(tmp_file)
             tmp_path = tmp_file.name
         
         try:
-            # Extract content
-            result = extractor.extract(tmp_path)
-            
-            # Convert to requested format
-            if output_format == 'markdown':
-                content = result.extract_markdown()
-            elif output_format == 'html':
-                content = result.extract_html()
-            elif output_format == 'json':
-                content = result.extract_data()
-                content = json.dumps(content, indent=2)
-            elif output_format == 'csv':
-                content = result.extract_csv(include_all_tables=True)
-            elif output_format == 'flat-json':
-                content = result.extract_data()
-                content = json.dumps(content, indent=2)
-            elif output_format == 'text':
-                content = result.extract_text()
-            else:
-                content = result.extract_markdown()  # Default to markdown
+            # GPU requests share one model; cap how many run on it at once
+            with _gpu_slots if processing_mode == 'gpu' else nullcontext():
+                # Extract content
+                result = extractor.extract(tmp_path)
+                
+                # Convert to requested format
+                if output_format == 'markdown':
+                    content = result.extract_markdown()
+                elif output_format == 'html':
+                    content = result.extract_html()
+                elif output_format == 'json':
+                    content = result.extract_data()
+                    content = json.dumps(content, indent=2)
+                elif output_format == 'csv':
+                    content = result.extract_csv(include_all_tables=True)
+                elif output_format == 'flat-json':
+                    content = result.extract_data()
+                    content = json.dumps(content, indent=2)
+                elif output_format == 'text':
+                    content = result.extract_text()
+                else:
+                    content = result.extract_markdown()  # Default to markdown
             
             # Get metadata
             metadata = {
@@ -171,7 +223,7 @@ def get_supported_formats():
 @app.route('/api/health')
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'version': '1.0.0'})
+    return jsonify({'status': 'healthy', 'version': '1.0.0', 'models_ready': models_ready()})
 
 @app.route('/api/system-info')
 def get_system_info():
@@ -0,0 +1,41 @@
+"""Tests for the Excel processor's table rendering helpers."""
+
+import pandas as pd
+
+from docstrange.processors.excel_processor import ExcelProcessor
+
+
+class TestDataframeToMarkdown:
+    """Test cases for rendering DataFrames as markdown tables."""
+    
+    def setup_method(self):
+        """Set up the processor under test."""
+        self.processor = ExcelProcessor()
+    
+    def test_header_and_rows(self):
+        """Test that the header, separator and data rows are rendered in order."""
+        df = pd.DataFrame({"Name": ["a", "b"], "Value": ["x", "y"]})
+        assert self.processor._dataframe_to_markdown(df, pd) == (
+            "| Name | Value |\n"
+            "| --- | --- |\n"
+            "| a | x |\n"
+            "| b | y |"
+        )
+    
+    def test_missing_cells_are_blank(self):
+        """Test that NaN and None cells render as empty cells."""
+        df = pd.DataFrame({"Name": ["a", None], "Score": [1.5, float("nan")]})
+        lines = self.processor._dataframe_to_markdown(df, pd).split("\n")
+        assert lines[2] == "| a | 1.5 |"
+        assert lines[3] == "|  |  |"
+    
+    def test_mixed_int_and_float_columns_keep_their_types(self):
+        """Test that integer cells are not upcast to floats by neighbouring float columns."""
+        df = pd.DataFrame({"Count": [1, 2], "Ratio": [0.5, 2.0]})
+        lines = self.processor._dataframe_to_markdown(df, pd).split("\n")
+        assert lines[2] == "| 1 | 0.5 |"
+        assert lines[3] == "| 2 | 2.0 |"
+    
+    def test_empty_dataframe(self):
+        """Test that an empty DataFrame renders a placeholder."""
+        assert self.processor._dataframe_to_markdown(pd.DataFrame(), pd) == "*No data available*"
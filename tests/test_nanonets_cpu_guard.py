@@ -0,0 +1,36 @@
+"""Tests for the Nanonets OCR GPU requirement and its CPU opt-in."""
+
+import pytest
+
+from docstrange.config import InternalConfig
+from docstrange.pipeline import nanonets_processor
+from docstrange.pipeline.ocr_service import NanonetsOCRService
+
+
+@pytest.fixture(autouse=True)
+def no_gpu(monkeypatch):
+    """Pretend no GPU is present and skip loading the model weights."""
+    monkeypatch.setattr(nanonets_processor, "is_gpu_available", lambda: False)
+    monkeypatch.setattr(
+        nanonets_processor.NanonetsDocumentProcessor, "_initialize_models", lambda self, cache_dir=None: None
+    )
+
+
+class TestNanonetsCpuGuard:
+    """Test cases for refusing CPU-only Nanonets OCR."""
+    
+    def test_refuses_without_gpu_by_default(self):
+        """Test that the service refuses to load without a GPU."""
+        with pytest.raises(RuntimeError, match="requires a CUDA GPU"):
+            NanonetsOCRService()
+    
+    def test_config_opt_in_allows_cpu(self, monkeypatch):
+        """Test that the config knob lets the service load on CPU."""
+        monkeypatch.setattr(InternalConfig, "nanonets_allow_cpu", True)
+        assert NanonetsOCRService() is not None
+    
+    def test_argument_overrides_config(self, monkeypatch):
+        """Test that an explicit allow_cpu argument wins over the config."""
+        monkeypatch.setattr(InternalConfig, "nanonets_allow_cpu", True)
+        with pytest.raises(RuntimeError):
+            NanonetsOCRService(allow_cpu=False)
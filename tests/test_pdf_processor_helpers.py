@@ -0,0 +1,344 @@
+"""Tests for the PDF processor's page rendering and extraction helpers."""
+
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
+import pytest
+
+from docstrange.config import InternalConfig
+from docstrange.processors import pdf_processor
+from docstrange.processors.pdf_processor import PDFProcessor, _select_dpi
+from docstrange.result import ConversionResult
+
+
+class TestSelectDpi:
+    """Test cases for DPI selection from pdfinfo output."""
+    
+    def test_letter_page_uses_default_dpi(self):
+        """Test that a regular page renders at the default DPI."""
+        dpi = _select_dpi({'Pages': 1, 'Page size': '612 x 792 pts (letter)'})
+        assert dpi == InternalConfig.pdf_ocr_image_dpi
+    
+    def test_small_page_uses_small_text_dpi(self):
+        """Test that receipt-sized pages render at the small-text DPI."""
+        dpi = _select_dpi({'Pages': 1, 'Page size': '226.77 x 600 pts'})
+        assert dpi == InternalConfig.pdf_image_dpi_small_text
+    
+    def test_large_page_is_capped(self):
+        """Test that large-format pages are capped at the maximum raster size."""
+        dpi = _select_dpi({'Pages': 1, 'Page size': '2384 x 3370 pts (A0)'})
+        assert dpi * 3370 / 72 <= InternalConfig.pdf_image_max_size
+    
+    def test_missing_page_size_uses_default_dpi(self):
+        """Test that missing page size information falls back to the default DPI."""
+        assert _select_dpi({'Pages': 1}) == InternalConfig.pdf_ocr_image_dpi
+
+
+class TestExtractOcrText:
+    """Test cases for pulling the OCR section out of an image result."""
+    
+    def setup_method(self):
+        """Set up a processor without loading OCR models."""
+        self.processor = PDFProcessor.__new__(PDFProcessor)
+    
+    def test_extracts_section_up_to_next_header(self):
+        """Test that only the OCR section is returned."""
+        result = ConversionResult(
+            "# Image\n\n## Extracted Text (OCR)\n\nFirst line\nSecond line\n\n## Metadata\nignored"
+        )
+        assert self.processor._extract_ocr_text_from_result(result) == "First line\nSecond line"
+    
+    def test_keeps_paragraph_breaks(self):
+        """Test that blank lines between OCR paragraphs are preserved."""
+        result = ConversionResult("## Extracted Text (OCR)\n\nParagraph one\n\nParagraph two")
+        assert self.processor._extract_ocr_text_from_result(result) == "Paragraph one\n\nParagraph two"
+    
+    def test_returns_full_content_without_ocr_section(self):
+        """Test that content without an OCR header is returned unchanged."""
+        result = ConversionResult("Plain page text")
+        assert self.processor._extract_ocr_text_from_result(result) == "Plain page text"
+    
+    def test_empty_section_does_not_swallow_next_header(self):
+        """Test that an empty OCR section yields no text rather than the next section."""
+        result = ConversionResult("## Extracted Text (OCR)\n\n## Next\nx")
+        assert self.processor._extract_ocr_text_from_result(result) == ""
+    
+    def test_section_at_end_of_content(self):
+        """Test that an OCR header with nothing after it yields no text."""
+        result = ConversionResult("# Image\n\n## Extracted Text (OCR)")
+        assert self.processor._extract_ocr_text_from_result(result) == ""
+
+
+class TestIntermediateFormat:
+    """Test cases for the page image format handed to OCR."""
+    
+    def setup_method(self):
+        """Set up a processor without loading OCR models."""
+        self.processor = PDFProcessor.__new__(PDFProcessor)
+        self.processor.include_images = False
+    
+    def _raster_options(self):
+        self.processor._intermediate_format = self.processor._resolve_intermediate_format()
+        return self.processor._raster_options()
+    
+    def test_jpeg_renders_jpeg(self, monkeypatch):
+        """Test that the default JPEG format is passed to pdf2image."""
+        monkeypatch.setattr(InternalConfig, "pdf_intermediate_format", "jpg")
+        assert self._raster_options()['fmt'] == 'jpeg'
+    
+    def test_include_images_keeps_png(self, monkeypatch):
+        """Test that page images stay lossless when they may be included in the output."""
+        monkeypatch.setattr(InternalConfig, "pdf_intermediate_format", "JPEG")
+        self.processor.include_images = True
+        assert self._raster_options() == {'fmt': 'png'}
+    
+    def test_unsupported_format_warns_and_uses_png(self, monkeypatch, caplog):
+        """Test that a format pdf2image cannot render falls back to PNG with a warning."""
+        monkeypatch.setattr(InternalConfig, "pdf_intermediate_format", "BMP")
+        assert self._raster_options() == {'fmt': 'png'}
+        assert "Unsupported pdf_intermediate_format 'BMP'" in caplog.text
+
+
+class _FakePool:
+    """Stand-in for the OCR worker pool that returns canned batch results."""
+    
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.shut_down = False
+    
+    def map(self, fn, tasks):
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        return [[(page_index, f"text of {path}") for path, page_index in task[0]] for task in tasks]
+    
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+class TestOcrPoolRecovery:
+    """Test cases for recovering from a broken OCR worker pool."""
+    
+    def setup_method(self):
+        """Set up a multi-worker processor without starting a real pool."""
+        self.processor = PDFProcessor.__new__(PDFProcessor)
+        self.processor._ocr_workers = 2
+        self.processor.preserve_layout = True
+        self.processor.include_images = False
+        self.processor.ocr_enabled = True
+        self.processor.use_markdownify = True
+    
+    def test_default_is_in_process(self):
+        """Test that OCR runs in-process unless worker processes are opted into."""
+        assert pdf_processor._resolve_ocr_workers() == 1
+    
+    def test_broken_pool_is_rebuilt_and_batch_retried(self, monkeypatch):
+        """Test that a broken pool is discarded and the batch succeeds on a fresh one."""
+        pools = [_FakePool(broken=True), _FakePool()]
+        monkeypatch.setattr(pdf_processor, "_get_ocr_pool", lambda workers: pools[0] if not pools[0].shut_down else pools[1])
+        
+        contents = self.processor._ocr_page_files(["a.jpg", "b.jpg", "c.jpg"])
+        
+        assert contents == ["text of a.jpg", "text of b.jpg", "text of c.jpg"]
+        assert pools[0].shut_down
+    
+    def test_pool_broken_twice_raises(self, monkeypatch):
+        """Test that a pool breaking again on retry surfaces the error."""
+        monkeypatch.setattr(pdf_processor, "_get_ocr_pool", lambda workers: _FakePool(broken=True))
+        
+        with pytest.raises(BrokenProcessPool):
+            self.processor._ocr_page_files(["a.jpg"])
+
+
+class _FakePage:
+    """Stand-in for a PyMuPDF page with a fixed text layer."""
+    
+    def __init__(self, text):
+        self._text = text
+        self.rect = SimpleNamespace(width=612, height=792)
+    
+    def get_text(self, kind, sort=False):
+        return self._text
+    
+    def find_tables(self):
+        return SimpleNamespace(tables=[])
+
+
+class _FakeDocument:
+    """Stand-in for a PyMuPDF document built from per-page text."""
+    
+    def __init__(self, page_texts):
+        self._pages = [_FakePage(text) for text in page_texts]
+        self.page_count = len(self._pages)
+    
+    def __getitem__(self, page_num):
+        return self._pages[page_num]
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TestTextLayerExtraction:
+    """Test cases for the born-digital PDF fast path."""
+    
+    TYPED_PAGE = "word " * pdf_processor._MIN_TEXT_LAYER_CHARS
+    
+    def setup_method(self):
+        """Set up a processor that records which pages it would OCR."""
+        self.processor = PDFProcessor.__new__(PDFProcessor)
+        self.processor.ocr_enabled = True
+        self.processor.preserve_layout = True
+        self.ocr_requests = []
+        
+        def fake_ocr(file_path, page_sizes):
+            self.ocr_requests.append(sorted(page_sizes))
+            return {page_num: f"scanned page {page_num + 1}" for page_num in page_sizes}
+        
+        self.processor._ocr_untexted_pages = fake_ocr
+    
+    def _process(self, monkeypatch, page_texts):
+        monkeypatch.setitem(sys.modules, "fitz", SimpleNamespace(open=lambda path: _FakeDocument(page_texts)))
+        return self.processor._process_with_text_layer("document.pdf")
+    
+    def test_sparse_text_layer_falls_back_to_ocr(self, monkeypatch):
+        """Test that pages averaging below the threshold are left to the OCR path."""
+        chars = pdf_processor._MIN_TEXT_LAYER_CHARS - 1
+        assert self._process(monkeypatch, ["x" * chars, "x" * chars]) is None
+        assert self.ocr_requests == []
+    
+    def test_text_layer_at_threshold_is_used(self, monkeypatch):
+        """Test that pages averaging exactly the threshold use the text layer."""
+        result = self._process(monkeypatch, ["x" * pdf_processor._MIN_TEXT_LAYER_CHARS])
+        assert result.metadata['extraction_method'] == 'text_layer'
+        assert self.ocr_requests == []
+    
+    def test_scanned_pages_in_typed_document_are_ocrd(self, monkeypatch):
+        """Test that pages without a text layer are OCR'd instead of dropped."""
+        page_texts = [self.TYPED_PAGE] * 3 + ["", "  \n", "Page 6 of 6\nABC0001234\n"]
+        result = self._process(monkeypatch, page_texts)
+        
+        assert self.ocr_requests == [[3, 4, 5]]
+        assert "## Page 4\n\nscanned page 4" in result.content
+        assert "## Page 5\n\nscanned page 5" in result.content
+        assert "## Page 6\n\nscanned page 6" in result.content
+        assert "ABC0001234" not in result.content
+        assert result.content.count("## Page") == 6
+        assert result.metadata['ocr_pages'] == [3, 4, 5]
+
+
+def _write_table_pdf(path):
+    """Write a born-digital PDF page with paragraphs around a ruled table."""
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 50), "Quarterly report " * 9, fontsize=8)
+    page.insert_text((72, 62), "Sales grew in every region " * 5, fontsize=8)
+    rows = [["Item", "Qty", "Price"], ["Apple", "3", "1.20"], ["Pear", "5", "0.80"]]
+    columns = [72, 200, 300, 400]
+    for row in range(len(rows) + 1):
+        page.draw_line((72, 100 + row * 20), (400, 100 + row * 20))
+    for x in columns:
+        page.draw_line((x, 100), (x, 160))
+    for row, cells in enumerate(rows):
+        for column, cell in enumerate(cells):
+            page.insert_text((columns[column] + 4, 114 + row * 20), cell)
+    page.insert_text((72, 200), "Closing remarks follow the table.")
+    doc.save(str(path))
+    doc.close()
+
+
+class TestTextLayerTables:
+    """Test cases for tables in the text layer of born-digital PDFs."""
+    
+    def test_table_is_rendered_as_markdown(self, tmp_path):
+        """Test that a ruled table keeps its rows as a markdown table in reading order."""
+        pdf_path = tmp_path / "table.pdf"
+        _write_table_pdf(pdf_path)
+        processor = PDFProcessor.__new__(PDFProcessor)
+        processor.preserve_layout = True
+        processor.ocr_enabled = False
+        
+        result = processor._process_with_text_layer(str(pdf_path))
+        
+        assert result.metadata['extraction_method'] == 'text_layer'
+        assert "| Item | Qty | Price |\n| --- | --- | --- |\n| Apple | 3 | 1.20 |\n| Pear | 5 | 0.80 |" in result.content
+        assert result.content.index("Quarterly report") < result.content.index("| Item") < result.content.index("Closing remarks")
+
+
+class TestPageDeduplication:
+    """Test cases for OCR result reuse across identical page images."""
+    
+    def setup_method(self):
+        """Set up a processor whose OCR backend records the images it is given."""
+        pdf_processor._page_cache.clear()
+        self.processor = PDFProcessor.__new__(PDFProcessor)
+        self.processor.preserve_layout = True
+        self.processor.include_images = False
+        self.processor.ocr_enabled = True
+        self.processor.use_markdownify = True
+        self.ocr_calls = []
+        self.ocr_output = {}
+        
+        def fake_ocr_page_files(page_paths):
+            self.ocr_calls.append(list(page_paths))
+            return [self.ocr_output.get(path, f"text of {path}") for path in page_paths]
+        
+        self.processor._ocr_page_files = fake_ocr_page_files
+    
+    def teardown_method(self):
+        """Drop cached pages so tests do not leak into each other."""
+        pdf_processor._page_cache.clear()
+    
+    def _write_pages(self, tmp_path, prefix, contents):
+        paths = []
+        for i, data in enumerate(contents):
+            path = tmp_path / f"{prefix}-{i}.jpg"
+            path.write_bytes(data)
+            paths.append(str(path))
+        return paths
+    
+    def test_duplicate_pages_in_document_are_ocrd_once(self, tmp_path):
+        """Test that identical page images within a document share one OCR call."""
+        paths = self._write_pages(tmp_path, "doc", [b"blank", b"body", b"blank"])
+        
+        pages = self.processor._ocr_pages(paths, start_index=10)
+        
+        assert self.ocr_calls == [[paths[0], paths[1]]]
+        assert pages == [(10, f"text of {paths[0]}"), (11, f"text of {paths[1]}"), (12, f"text of {paths[0]}")]
+    
+    def test_pages_seen_in_earlier_document_are_not_ocrd_again(self, tmp_path):
+        """Test that the page cache carries OCR results across documents."""
+        first = self._write_pages(tmp_path, "first", [b"letterhead", b"body one"])
+        second = self._write_pages(tmp_path, "second", [b"letterhead", b"body two"])
+        
+        self.processor._ocr_pages(first)
+        pages = self.processor._ocr_pages(second)
+        
+        assert self.ocr_calls[1] == [second[1]]
+        assert pages[0] == (0, f"text of {first[0]}")
+    
+    def test_empty_results_are_not_cached_across_documents(self, tmp_path):
+        """Test that an empty OCR result is retried for the next document."""
+        first = self._write_pages(tmp_path, "first", [b"faint scan"])
+        second = self._write_pages(tmp_path, "second", [b"faint scan"])
+        self.ocr_output[first[0]] = ""
+        
+        self.processor._ocr_pages(first)
+        pages = self.processor._ocr_pages(second)
+        
+        assert self.ocr_calls == [first, second]
+        assert pages == [(0, f"text of {second[0]}")]
+    
+    def test_cache_is_keyed_by_processor_options(self, tmp_path):
+        """Test that the same image is OCR'd again under different options."""
+        first = self._write_pages(tmp_path, "first", [b"page"])
+        second = self._write_pages(tmp_path, "second", [b"page"])
+        
+        self.processor._ocr_pages(first)
+        self.processor.preserve_layout = False
+        self.processor._ocr_pages(second)
+        
+        assert self.ocr_calls == [first, second]
@@ -0,0 +1,33 @@
+"""Tests for the temporary file helpers."""
+
+import pytest
+
+from docstrange.utils import temp_utils
+
+
+@pytest.fixture(autouse=True)
+def reset_fast_temp_dir(monkeypatch):
+    """Re-resolve the fast temp dir in every test."""
+    monkeypatch.setattr(temp_utils, "_fast_temp_dir", None)
+    monkeypatch.setattr(temp_utils, "_fast_temp_dir_resolved", False)
+
+
+class TestGetFastTempDir:
+    """Test cases for choosing the RAM-backed temp directory."""
+    
+    def test_uses_shm_with_enough_space(self, tmp_path, monkeypatch):
+        """Test that a writable directory with enough free space is used."""
+        monkeypatch.setattr(temp_utils, "SHM_DIR", str(tmp_path))
+        monkeypatch.setattr(temp_utils, "_free_bytes", lambda path: temp_utils.MIN_FREE_BYTES)
+        assert temp_utils.get_fast_temp_dir() == str(tmp_path)
+    
+    def test_small_shm_falls_back_to_default(self, tmp_path, monkeypatch):
+        """Test that a small /dev/shm (e.g. Docker's 64 MB default) is not used."""
+        monkeypatch.setattr(temp_utils, "SHM_DIR", str(tmp_path))
+        monkeypatch.setattr(temp_utils, "_free_bytes", lambda path: 64 * 1024 * 1024)
+        assert temp_utils.get_fast_temp_dir() is None
+    
+    def test_missing_shm_falls_back_to_default(self, tmp_path, monkeypatch):
+        """Test that a missing /dev/shm falls back to the default temp dir."""
+        monkeypatch.setattr(temp_utils, "SHM_DIR", str(tmp_path / "missing"))
+        assert temp_utils.get_fast_temp_dir() is None